@@ -1,4 +1,6 @@
 import collections.abc
+import functools
+import itertools
 import math
 import datetime as dt
 
@@ -21,7 +23,41 @@ def collapse_element_list(*args):
     """
     flatten any number of lists of elements to a list of elements
     """
-    return [e for built_ins in args for built_in in built_ins for e in safe_get_element_list(built_in) if built_ins is not None and built_in is not None]
+    return list(itertools.chain.from_iterable(safe_get_element_list(built_in) for built_ins in args for built_in in built_ins))
+
+
+def min_max(values):
+    """
+    find the minimum and maximum of a series in a single pass
+    :param values: actual values
+    """
+    iterator = iter(values)
+    try:
+        value_min = value_max = next(iterator)
+    except StopIteration:
+        raise ValueError("Values must be a non-empty iterable.") from None
+    for value in iterator:
+        if value < value_min:
+            value_min = value
+        elif value > value_max:
+            value_max = value
+    return value_min, value_max
+
+
+def has_unique_values(values, count):
+    """
+    check whether a series contains at least a number of unique values, stopping as soon as it does
+    :param values: actual values
+    :param count: required number of unique values
+    """
+    if count <= 0:
+        return True
+    seen = set()
+    for value in values:
+        seen.add(value)
+        if len(seen) >= count:
+            return True
+    return False
 
 
 def get_numeric_limits(
@@ -39,7 +75,7 @@ def get_numeric_limits(
     :param max_value: optional maximum value to include in limits
     :param include_zero: whether to include zero in limits
     """
-    value_min, value_max = min(values), max(values)
+    value_min, value_max = min_max(values)
     if min_value:
         value_min = min(value_min, min_value)
     if max_value:
@@ -49,13 +85,37 @@ def get_numeric_limits(
             value_min = 0
         if value_max < 0:
             value_max = 0
+    return list(_numeric_limits(value_min, value_max, max_ticks))
+
+
+@functools.lru_cache(maxsize=256)
+def _numeric_limits(value_min, value_max, max_ticks):
+    """
+    compute (cached) numeric limits from the extremes of a series of numbers
+    :param value_min: minimum value to include in limits
+    :param value_max: maximum value to include in limits
+    :param max_ticks: maximum number of ticks
+    """
+    pad, start, end = _numeric_limits_core(value_min, value_max, max_ticks)
+    return tuple(y * pad for y in range(start, end + 1))
+
+
+def _numeric_limits_core(value_min, value_max, max_ticks):
+    """
+    compute the tick spacing and the first and last tick index for a range of numbers
+    :param value_min: minimum value to include in limits
+    :param value_max: maximum value to include in limits
+    :param max_ticks: maximum number of ticks
+    """
     raw_pad = (1.2 * value_max - 0.95 * value_min) / max_ticks
-    remainder = math.log10(abs(raw_pad)) - int(math.log10(abs(raw_pad)))
-    leader = 2 if remainder < 0.301 else (5 if remainder < 0.698 else 10)
-    pad = leader * 10 ** int(math.log10(abs(raw_pad)))
+    magnitude = math.log10(abs(raw_pad))
+    exponent = int(magnitude)
+    remainder = magnitude - exponent
+    leader = (2, 5, 10)[(remainder >= 0.301) + (remainder >= 0.698)]
+    pad = leader * 10 ** exponent
     start = int(math.floor(0.95 * value_min / pad))
     end = int(math.ceil(1.2 * value_max / pad))
-    return [y * pad for y in range(start, end + 1)]
+    return pad, start, end
 
 
 def get_date_or_time_limits(dates, max_ticks=10):
@@ -64,7 +124,20 @@ def get_date_or_time_limits(dates, max_ticks=10):
     :param dates: actual dates/datetimes
     :param max_ticks: maximum number of ticks
     """
-    date_min, date_max = min(dates), max(dates)
+    date_min, date_max = min_max(dates)
+    return list(_date_or_time_limits(date_min, date_max, max_ticks, getattr(date_min, 'tzinfo', None), getattr(date_max, 'tzinfo', None)))
+
+
+@functools.lru_cache(maxsize=256, typed=True)
+def _date_or_time_limits(date_min, date_max, max_ticks, tz_min, tz_max):
+    """
+    compute (cached) date limits from the extremes of a series of dates/datetimes
+    :param date_min: earliest date/datetime
+    :param date_max: latest date/datetime
+    :param max_ticks: maximum number of ticks
+    :param tz_min: timezone of date_min, part of the cache key as equal instants in different zones give different ticks
+    :param tz_max: timezone of date_max, part of the cache key as equal instants in different zones give different ticks
+    """
     if date_min >= date_max:
         raise ValueError("Dates must have a positive range.")
 
@@ -95,16 +168,14 @@ def get_date_or_time_limits(dates, max_ticks=10):
         start = date_min.replace(day=1)
         end = (date_max.replace(day=1) + dt.timedelta(days=32)).replace(day=1)  # first day of next month
 
-        ticks = []
-        current_tick = start
-        while current_tick <= end:
-            ticks.append(current_tick)
-            month = current_tick.month + interval_months
-            year = current_tick.year + (month - 1) // 12
-            month = (month - 1) % 12 + 1
-            current_tick = current_tick.replace(year=year, month=month)
+        # step through months as a single index (year * 12 + month - 1)
+        start_index = start.year * 12 + start.month - 1
+        end_index = end.year * 12 + end.month - 1
+        ticks = [start.replace(year=m // 12, month=m % 12 + 1) for m in range(start_index, end_index + 1, interval_months)]
+        if ticks[-1] > end:
+            ticks.pop()
 
-        return ticks
+        return tuple(ticks)
 
     ticks = []
     current_tick = date_min.replace(second=0, microsecond=0)
@@ -114,7 +185,7 @@ def get_date_or_time_limits(dates, max_ticks=10):
             break
         current_tick += interval
 
-    return ticks
+    return tuple(ticks)
 
 
 def get_limits(
@@ -134,7 +205,7 @@ def get_limits(
     :param include_zero: whether to include zero in limits
     :param min_unique_values: minimum number of unique values required
     """
-    if values is None or not isinstance(values, collections.abc.Iterable) or len(set(values)) < min_unique_values:
+    if values is None or not isinstance(values, collections.abc.Iterable) or not has_unique_values(values, min_unique_values):
         raise ValueError("Values must be a non-empty iterable with at least %d unique elements.", min_unique_values)
     if all(isinstance(v, (dt.datetime, dt.date)) for v in values):
         return get_date_or_time_limits(values, max_ticks)
@@ -150,7 +221,20 @@ def get_limits(
         raise TypeError("Invalid data types in values")
 
 
+@functools.lru_cache(maxsize=256)
+def _even_positions(start, length, count):
+    """
+    compute (cached) evenly spaced positions along an axis
+    :param start: position of the first point
+    :param length: distance between the first and last point
+    :param count: number of points
+    """
+    divisor = count - 1
+    return tuple(start + i * length / divisor for i in range(count))
+
+
 class Point:
+    __slots__ = ('x', 'y')
 
     def __init__(self, x_position, y_position):
         self.x = x_position
@@ -158,6 +242,7 @@ class Point:
 
 
 class Shape:
+    __slots__ = ('position', 'styles')
 
     def __init__(self, x_position, y_position):
         self.position = Point(x_position, y_position)
@@ -165,14 +250,14 @@ class Shape:
 
     @property
     def render_styles(self):
-        return " ".join([style + '="' + self.styles[style] + '"' for style in self.styles])
+        return ' '.join(f'{style}="{value}"' for style, value in self.styles.items())
 
     def get_element_list(self):
         raise NotImplementedError("Not implemented in generic shape.")
 
 
 class Line(Shape):
-    line_template = '<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" {styles}/>'
+    __slots__ = ('end',)
 
     def __init__(self, x_position, y_position, width, height, styles=None):
         super().__init__(x_position, y_position)
@@ -184,11 +269,11 @@ class Line(Shape):
         return self.position
 
     def get_element_list(self):
-        return [self.line_template.format(x1=self.start.x, y1=self.start.y, x2=self.end.x, y2=self.end.y, styles=self.render_styles)]
+        return [f'<line x1="{self.position.x}" y1="{self.position.y}" x2="{self.end.x}" y2="{self.end.y}" {self.render_styles}/>']
 
 
 class Circle(Shape):
-    circle_template = '<circle cx="{x}" cy="{y}" r="{r}" {styles}/>'
+    __slots__ = ('radius',)
 
     def __init__(self, x_position, y_position, radius, styles=None):
         super().__init__(x_position, y_position)
@@ -196,7 +281,7 @@ class Circle(Shape):
         self.radius = radius
 
     def get_element_list(self):
-        return [self.circle_template.format(x=self.position.x, y=self.position.y, r=self.radius, styles=self.render_styles)]
+        return [f'<circle cx="{self.position.x}" cy="{self.position.y}" r="{self.radius}" {self.render_styles}/>']
 
 
 class DonutSegment(Shape):
@@ -284,7 +369,7 @@ class DonutSegment(Shape):
 
 
 class Text(Shape):
-    text_template = '<text x="{x}" y="{y}" {styles}>{content}</text>'
+    __slots__ = ('content',)
 
     def __init__(self, x_position, y_position, content, styles=None):
         super().__init__(x_position, y_position)
@@ -292,7 +377,7 @@ class Text(Shape):
         self.content = content
 
     def get_element_list(self):
-        return [self.text_template.format(x=self.position.x, y=self.position.y, content=self.content, styles=self.render_styles)]
+        return [f'<text x="{self.position.x}" y="{self.position.y}" {self.render_styles}>{self.content}</text>']
 
 
 class Axis(Shape):
@@ -327,12 +412,15 @@ class Axis(Shape):
             include_zero=include_zero,
             min_unique_values=min_unique_values,
         )
+        self._lim_min = min(self.limits)
+        self._lim_range = max(self.limits) - self._lim_min
         self.label_format = label_format
         self.axis_line = None
         self.tick_lines, self.tick_texts, self.grid_lines = [], [], []
+        self.tick_offsets = []
 
     def proportion_of_range(self, value):
-        return (value - min(self.limits)) / (max(self.limits) - min(self.limits))
+        return (value - self._lim_min) / self._lim_range
 
     def get_element_list(self):
         return collapse_element_list([self.axis_line], self.tick_lines, self.tick_texts, self.grid_lines)
@@ -374,13 +462,15 @@ class XAxis(Axis):
         )
         styles = axis_styles or self.default_axis_styles.copy()
         self.axis_line = Line(x_position=self.position.x, y_position=self.position.y, width=axis_length, height=0, styles=styles)
-        for i, m in enumerate(self.limits):
-            width_offset = i * self.length / (len(self.limits) - 1) + self.position.x
+        divisor = len(self.limits) - 1
+        self.tick_offsets = [i * self.length / divisor + self.position.x for i in range(len(self.limits))]
+        for width_offset, m in zip(self.tick_offsets, self.limits):
             self.tick_lines.append(Line(x_position=width_offset, width=0, y_position=self.position.y, height=tick_length, styles=styles))
             self.tick_texts.append(Text(x_position=width_offset, y_position=self.position.y + 2 * tick_length, content=label_format(m), styles=self.default_tick_text_styles.copy()))
 
     def get_positions(self, values):
-        return [self.position.x + self.proportion_of_range(v) * self.length for v in values]
+        x, lim_min, lim_range, length = self.position.x, self._lim_min, self._lim_range, self.length
+        return [x + (v - lim_min) / lim_range * length for v in values]
 
 
 class YAxis(Axis):
@@ -421,8 +511,9 @@ class YAxis(Axis):
         )
         styles = axis_styles or self.default_axis_styles.copy()
         self.axis_line = Line(x_position=self.position.x, y_position=self.position.y, width=0, height=axis_length, styles=styles)
-        for i, m in enumerate(self.limits):
-            height_offset = (len(self.limits) - 1 - i) * self.length / (len(self.limits) - 1) + self.position.y
+        divisor = len(self.limits) - 1
+        self.tick_offsets = [(divisor - i) * self.length / divisor + self.position.y for i in range(len(self.limits))]
+        for height_offset, m in zip(self.tick_offsets, self.limits):
             if secondary:
                 self.tick_lines.append(Line(x_position=self.position.x, width=tick_length, y_position=height_offset, height=0, styles=styles))
                 self.tick_texts.append(Text(x_position=self.position.x + 2 * tick_length, y_position=height_offset, content=label_format(m), styles=self.default_sec_tick_text_styles.copy()))
@@ -431,7 +522,8 @@ class YAxis(Axis):
                 self.tick_texts.append(Text(x_position=self.position.x - 2 * tick_length, y_position=height_offset, content=label_format(m), styles=self.default_tick_text_styles.copy()))
 
     def get_positions(self, values):
-        return [self.position.y + self.length * (1 - self.proportion_of_range(v)) for v in values]
+        y, lim_min, lim_range, length = self.position.y, self._lim_min, self._lim_range, self.length
+        return [y + length * (1 - (v - lim_min) / lim_range) for v in values]
 
 
 class SimpleXAxis(XAxis):
@@ -440,28 +532,48 @@ class SimpleXAxis(XAxis):
     """
 
     def get_positions(self, x_values):
-        return [self.position.x + x * self.length / (len(x_values) - 1) for x in range(len(x_values))]
+        return list(_even_positions(self.position.x, self.length, len(x_values)))
 
 
 class SimpleLineSeries(Shape):
     """
-    line series given as a number of (x, y)-points
+    line series given as parallel, read-only sequences of x and y positions
     """
     path_default_styles = {'stroke-width': '2'}
-    path_begin_template = '<path d="{path}" fill="none" {styles}/>'
 
-    def __init__(self, points):
-        super().__init__(points[0].x, points[0].y)
-        self.points = points
+    def __init__(self, x_positions, y_positions):
+        self._xs = tuple(x_positions)
+        self._ys = tuple(y_positions)
+        super().__init__(self._xs[0], self._ys[0])
         self.styles = self.path_default_styles.copy()
+        self._path_length = None
+
+    @property
+    def xs(self):
+        return self._xs
+
+    @property
+    def ys(self):
+        return self._ys
+
+    @property
+    def points(self):
+        """
+        read-only view of the positions as points, changing these points does not move the series
+        """
+        return tuple(Point(x, y) for x, y in zip(self.xs, self.ys))
 
     def get_element_list(self):
-        path = ' '.join(['{0} {1} {2}'.format("L" if i else "M", p.x, p.y) for i, p in enumerate(self.points)])
-        return [self.path_begin_template.format(path=path, styles=self.render_styles)]
+        xs, ys = self.xs, self.ys
+        path = ' '.join([f'M {xs[0]} {ys[0]}', *[f'L {x} {y}' for x, y in zip(xs[1:], ys[1:])]])
+        return [f'<path d="{path}" fill="none" {self.render_styles}/>']
 
     @property
     def path_length(self):
-        return sum(math.sqrt((p2.x - p1.x) ** 2 + (p2.y - p1.y) ** 2) for p1, p2 in zip(self.points, self.points[1:])) if len(self.points) > 2 else 0
+        if self._path_length is None:
+            xs, ys = self.xs, self.ys
+            self._path_length = sum(map(math.hypot, [x2 - x1 for x1, x2 in zip(xs, xs[1:])], [y2 - y1 for y1, y2 in zip(ys, ys[1:])])) if len(xs) > 2 else 0
+        return self._path_length
 
 
 class LineLegend(Shape):
@@ -507,12 +619,22 @@ class Chart:
     def add_custom_element(self, custom_element):
         self.custom_elements.append(custom_element)
 
-    def render(self):
-        return '\n'.join([
-            self.svg_begin_template.format(height=self.height, width=self.width),
-            *self.get_element_list(),
-            '</svg>'
-        ])
+    def render(self, out=None):
+        """
+        render the chart as svg
+        :param out: optional file-like object to write the svg to instead of returning it
+        """
+        if out is None:
+            return '\n'.join([
+                self.svg_begin_template.format(height=self.height, width=self.width),
+                *self.get_element_list(),
+                '</svg>'
+            ])
+        out.write(self.svg_begin_template.format(height=self.height, width=self.width))
+        for element in self.get_element_list():
+            out.write('\n')
+            out.write(element)
+        out.write('\n</svg>')
 
 
 class SimpleLineChart(Chart):
@@ -615,13 +737,9 @@ class SimpleLineChart(Chart):
             max_value=x_max,
             include_zero=x_zero,
         )
+        x_positions = self.x_axis.get_positions(x_values)
         self.series = {
-            name: SimpleLineSeries(
-                [
-                    Point(x, y)
-                    for x, y in zip(self.x_axis.get_positions(x_values), self.y_axis.get_positions(y_value))
-                ],
-            )
+            name: SimpleLineSeries(x_positions, self.y_axis.get_positions(y_value))
             for name, y_value in zip(series_names, y_values)
         }
         if sec_y_values is not None:
@@ -641,12 +759,7 @@ class SimpleLineChart(Chart):
             )
             self.series.update(
                 {
-                    name: SimpleLineSeries(
-                        [
-                            Point(x, y)
-                            for x, y in zip(self.x_axis.get_positions(x_values), self.sec_y_axis.get_positions(y_value))
-                        ]
-                    )
+                    name: SimpleLineSeries(x_positions, self.sec_y_axis.get_positions(y_value))
                     for name, y_value in zip(sec_series_names, sec_y_values)
                 }
             )
@@ -668,8 +781,8 @@ class SimpleLineChart(Chart):
     def add_y_grid(self, minor_ticks=0, major_grid_style=None, minor_grid_style=None):
         major_style = major_grid_style.copy() if major_grid_style is not None else self.default_major_grid_styles.copy()
         minor_style = minor_grid_style.copy() if minor_grid_style is not None else self.default_minor_grid_styles.copy()
-        for i, m in enumerate(self.x_axis.limits[1:]):
-            width_offset = (i + 1) * self.x_axis.length / (len(self.x_axis.limits) - 1) + self.y_axis.position.x
+        minor_step = self.x_axis.length / (len(self.x_axis.limits) - 1) / (minor_ticks + 1)
+        for width_offset in self.x_axis.tick_offsets[1:]:
             self.y_axis.grid_lines.append(
                 Line(
                     x_position=width_offset,
@@ -679,7 +792,6 @@ class SimpleLineChart(Chart):
                     styles=major_style
                 )
             )
-            minor_step = self.x_axis.length / (len(self.x_axis.limits) - 1) / (minor_ticks + 1)
             for j in range(1, minor_ticks + 1):
                 minor_offset = width_offset - j * minor_step
                 self.y_axis.grid_lines.append(Line(
@@ -693,23 +805,22 @@ class SimpleLineChart(Chart):
     def add_x_grid(self, minor_ticks=0, major_grid_style=None, minor_grid_style=None):
         major_style = major_grid_style.copy() if major_grid_style is not None else self.default_major_grid_styles.copy()
         minor_style = minor_grid_style.copy() if minor_grid_style is not None else self.default_minor_grid_styles.copy()
-        for i, m in enumerate(self.y_axis.limits[1:]):
-            height_offset = (len(self.y_axis.limits) - 2 - i) * self.y_axis.length / (len(self.y_axis.limits) - 1) + self.x_axis.position.y
+        minor_step = self.y_axis.length / (len(self.y_axis.limits) - 1) / (minor_ticks + 1)
+        for height_offset in self.y_axis.tick_offsets[1:]:
             self.x_axis.grid_lines.append(
                 Line(
                     x_position=self.y_axis.position.x,
-                    y_position=height_offset - self.y_axis.length,
+                    y_position=height_offset,
                     width=self.x_axis.length,
                     height=0,
                     styles=major_style
                 )
             )
-            minor_step = self.y_axis.length / (len(self.y_axis.limits) - 1) / (minor_ticks + 1)
             for j in range(1, minor_ticks + 1):
                 minor_offset = height_offset + j * minor_step
                 self.y_axis.grid_lines.append(Line(
                     x_position=self.y_axis.position.x,
-                    y_position=minor_offset - self.y_axis.length,
+                    y_position=minor_offset,
                     width=self.x_axis.length,
                     height=0,
                     styles=minor_style
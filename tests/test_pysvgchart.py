@@ -3,6 +3,7 @@ import pysvgchart as psc
 import random
 import os
 import datetime as dt
+import io
 import math
 
 random.seed(42)
@@ -13,7 +14,7 @@ def write_out(chart, name):
     output_file = os.path.join(output_dir, name)
     os.makedirs(output_dir, exist_ok=True)
     with open(output_file, 'w+') as out_file:
-        out_file.write(chart.render())
+        chart.render(out_file)
     return output_file
 
 
@@ -83,3 +84,65 @@ def test_donut():
     values = [10, 20, 30, 40]
     donut_chart = psc.DonutChart(values)
     write_out(donut_chart, name="donut.svg")
+
+
+def test_shape_rendering():
+    line = psc.Line(x_position=1, y_position=2, width=3, height=4, styles={'stroke': 'red'})
+    circle = psc.Circle(x_position=1, y_position=2, radius=3, styles={'fill': 'blue', 'stroke-width': 2})
+    text = psc.Text(x_position=1, y_position=2, content='label')
+    assert line.get_element_list() == ['<line x1="1" y1="2" x2="4" y2="6" stroke="red"/>']
+    assert circle.get_element_list() == ['<circle cx="1" cy="2" r="3" fill="blue" stroke-width="2"/>']
+    assert text.get_element_list() == ['<text x="1" y="2" >label</text>']
+
+
+def test_equal_style_values_render_distinctly():
+    assert psc.Circle(x_position=0, y_position=0, radius=1, styles={'stroke-width': 2.0}).render_styles == 'stroke-width="2.0"'
+    assert psc.Circle(x_position=0, y_position=0, radius=1, styles={'stroke-width': 2}).render_styles == 'stroke-width="2"'
+    assert psc.Circle(x_position=0, y_position=0, radius=1, styles={'opacity': 1}).render_styles == 'opacity="1"'
+    assert psc.Circle(x_position=0, y_position=0, radius=1, styles={'opacity': True}).render_styles == 'opacity="True"'
+
+
+def test_limits_are_not_shared_between_calls():
+    limits = psc.pysvgchart.get_limits([1, 5, 9], max_ticks=5)
+    limits.append('mutated')
+    assert 'mutated' not in psc.pysvgchart.get_limits([9, 1, 5], max_ticks=5)
+
+
+def test_date_limits_keep_timezone_between_calls():
+    utc_dates = [dt.datetime(2024, 1, 1, tzinfo=dt.timezone.utc) + dt.timedelta(days=i) for i in range(90)]
+    cet = dt.timezone(dt.timedelta(hours=1))
+    psc.pysvgchart.get_limits(utc_dates, max_ticks=5)
+    limits = psc.pysvgchart.get_limits([d.astimezone(cet) for d in utc_dates], max_ticks=5)
+    assert all(limit.tzinfo == cet for limit in limits), "Date limits reused another timezone's ticks."
+
+
+def test_line_series_points():
+    series = psc.pysvgchart.SimpleLineSeries([0, 3, 3], [0, 4, 0])
+    assert [(p.x, p.y) for p in series.points] == [(0, 0), (3, 4), (3, 0)]
+    assert isinstance(series.points, tuple)
+    assert series.path_length == 9.0
+    with pytest.raises((AttributeError, TypeError)):
+        series.ys[1] = 0
+    assert series.get_element_list()[0].startswith('<path d="M 0 0 L 3 4 L 3 0"')
+
+
+def test_limit_helpers():
+    assert psc.pysvgchart.min_max([3, -1, 7, 2]) == (-1, 7)
+    assert psc.pysvgchart.has_unique_values([1, 1, 2], 2)
+    assert not psc.pysvgchart.has_unique_values([1, 1, 1], 2)
+    with pytest.raises(ValueError):
+        psc.pysvgchart.get_limits([5, 5, 5], max_ticks=5)
+
+
+def test_tick_labels_restyle_independently():
+    line_chart = psc.SimpleLineChart(x_values=list(range(10)), y_values=[list(range(10))], sec_y_values=[list(range(10))])
+    for axis in (line_chart.x_axis, line_chart.y_axis, line_chart.sec_y_axis):
+        axis.tick_texts[0].styles['fill'] = 'red'
+        assert not any('fill' in tick.styles for tick in axis.tick_texts[1:]), "Tick label styles are shared."
+
+
+def test_render_to_file_like():
+    donut_chart = psc.DonutChart([1, 2, 3])
+    out = io.StringIO()
+    donut_chart.render(out)
+    assert out.getvalue() == donut_chart.render()